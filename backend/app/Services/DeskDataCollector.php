@@ -17,21 +17,19 @@ public function __construct(
     
     public function collect(): array
     {
-        $deskIds = $this->client->getDesks();
+        $desks = $this->client->getDesksBulk();
 
         $now = Carbon::now();
 
         $summary = [
-            'desks_seen' => count($deskIds),
+            'desks_seen' => count($desks),
             'state_rows_inserted' => 0,
             'usage_rows_inserted' => 0,
             'error_rows_inserted' => 0,
         ];
 
-        foreach ($deskIds as $deskId) {
+        foreach ($desks as $deskId => $deskData) {
             try {
-                $deskData = $this->client->getDesk($deskId);
-
                 $config     = $deskData['config']     ?? [];
                 $state      = $deskData['state']      ?? [];
                 $usage      = $deskData['usage']      ?? [];
@@ -42,4 +42,13 @@ public function getDesk(string $deskId): array
 
         return $response->json() ?? [];
     }
+
+    public function getDesksBulk(): array
+    {
+        $response = Http::get($this->buildUrl('desks/bulk'));
+
+        $response->throw();
+
+        return $response->json() ?? [];
+    }
 }
@@ -9,6 +9,7 @@ class Desk:
     COLLISION_CHANCE = 0.03
     MAX_ERROR_COUNT = 10
     ERROR_CODE_E93 = 93
+    CATEGORIES = ("config", "state", "usage", "lastErrors")
 
     def __init__(self, desk_id, name, manufacturer, initial_position=680, min_position=680, max_position=1320):
         self.desk_id = desk_id
@@ -120,15 +121,10 @@ class Desk:
                     self.target_position_mm = self.state["position_mm"]
                     self.state["speed_mms"] = 0
 
-    def get_data(self):
-        """Get a snapshot of the desk's data."""
+    def get_data(self, categories=CATEGORIES):
+        """Get a snapshot of the desk's data, optionally limited to some categories."""
         with self.lock:
-            return {
-                "config": self.config,
-                "state": self.state,
-                "usage": self.usage,
-                "lastErrors": self.lastErrors,
-            }
+            return {category: getattr(self, category).copy() for category in categories}
 
     def update_category(self, category, data):
         """Update a specific category of the desk."""
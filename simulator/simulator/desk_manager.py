@@ -24,7 +24,7 @@ class DeskManager:
         self.simulation_thread = None
         self.power_off_thread = None
         self.stop_event = threading.Event()
-        self.lock = threading.Lock()
+        self.lock = threading.RLock()
         self.current_time_s = 43200
         self.simulation_speed = simulation_speed
         self.load_state()
@@ -42,19 +42,31 @@ class DeskManager:
                 return None
             return self.desks.get(desk_id)
 
-    def get_desk_data(self, desk_id):
+    def get_desk_data(self, desk_id, categories=Desk.CATEGORIES):
         """Get a desk's data snapshot by its ID."""
         logger.debug(f"Retrieving data for desk ID={desk_id}.")
         desk = self.get_desk(desk_id)
-        return desk.get_data() if desk else None
+        return desk.get_data(categories) if desk else None
+
+    def get_desks_data(self, desk_ids=None, categories=Desk.CATEGORIES):
+        """Get one consistent data snapshot of several desks (all powered-on desks by default)."""
+        with self.lock:
+            if desk_ids is None:
+                desk_ids = self.get_desk_ids()
+            snapshot = {}
+            for desk_id in desk_ids:
+                data = self.get_desk_data(desk_id, categories)
+                if data is not None:
+                    snapshot[desk_id] = data
+            logger.debug(f"Retrieved bulk data for {len(snapshot)} desks.")
+            return snapshot
 
     def get_desk_category(self, desk_id, category):
         """Get a specific category from a desk."""
-        desk = self.get_desk(desk_id)
-        if desk:
-            data = desk.get_data()
-            return data.get(category)
-        return None
+        if category not in Desk.CATEGORIES:
+            return None
+        data = self.get_desk_data(desk_id, (category,))
+        return data[category] if data else None
 
     def update_desk_category(self, desk_id, category, data):
         """Update a specific category of a desk."""
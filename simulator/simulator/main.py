@@ -2,10 +2,10 @@ import argparse
 import ssl
 import random
 import logging
-from http.server import HTTPServer
 from users import UserType
 from desk_manager import DeskManager
 from simple_rest_server import SimpleRESTServer
+from servers import SERVER_ENGINES, create_server
 
 logger = logging.getLogger("main")
 
@@ -27,7 +27,8 @@ def generate_desk_id():
 def generate_desk_name():
     return f"DESK {random.randint(1000, 9999)}"
 
-def run(server_class=HTTPServer, handler_class=SimpleRESTServer, port=8000, use_https=False, cert_file=None, key_file=None, desks=2, speed=60):
+def run(server="threaded", handler_class=SimpleRESTServer, port=8000, use_https=False, cert_file=None, key_file=None, desks=2, speed=60,
+        workers=16, backlog=128, keepalive_timeout=15):
     logger.info(f"Initializing DeskManager with simulation speed: {speed}")
     desk_manager = DeskManager(speed)
 
@@ -47,7 +48,6 @@ def run(server_class=HTTPServer, handler_class=SimpleRESTServer, port=8000, use_
 
     server_address = ("localhost", port)
     SimpleRESTServer.initialize_api_keys()
-    httpd = server_class(server_address, handler)
 
     if use_https:
         if not cert_file or not key_file:
@@ -55,19 +55,21 @@ def run(server_class=HTTPServer, handler_class=SimpleRESTServer, port=8000, use_
             raise ValueError("Both certificate and key files must be provided for HTTPS.")
         context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
         context.load_cert_chain(certfile=cert_file, keyfile=key_file)
-
-        httpd.socket = context.wrap_socket(httpd.socket, server_side=True)
         protocol = "HTTPS"
     else:
+        context = None
         protocol = "HTTP"
 
-    logger.info(f"Starting {protocol} server on port {port}...")
+    httpd = create_server(server, server_address, handler, context, workers, backlog, keepalive_timeout)
+
+    logger.info(f"Starting {protocol} server on port {port} ({server} engine)...")
 
     try:
         httpd.serve_forever()
     except KeyboardInterrupt:
         logger.info("Shutting down server...")
     finally:
+        httpd.server_close()
         desk_manager.stop_updates()  # Stop the desk updates
         logger.info("Server stopped.")
 
@@ -87,6 +89,10 @@ if __name__ == "__main__":
     parser.add_argument("--keyfile", type=str, help="Path to the SSL key file")
     parser.add_argument("--desks", type=int, default=2, help="Minimum number of desks to simulate (default: 2)")
     parser.add_argument("--speed", type=int, default=60, help="Simulation speed (default: 60)")
+    parser.add_argument("--server", type=str, choices=SERVER_ENGINES, default="threaded", help="HTTP serving engine (default: threaded)")
+    parser.add_argument("--workers", type=int, default=16, help="Worker threads serving requests for the threaded and asyncio engines (default: 16)")
+    parser.add_argument("--backlog", type=int, default=128, help="Listen backlog for pending connections (default: 128)")
+    parser.add_argument("--keepalive-timeout", type=float, default=15, help="Seconds an idle keep-alive connection is kept open (default: 15)")
     parser.add_argument("--log-level", type=str, default="INFO", help="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)")
 
     args = parser.parse_args()
@@ -101,6 +107,7 @@ if __name__ == "__main__":
         logger.info(f"Key file: {args.keyfile}")
     logger.info(f"Number of desks: {args.desks}")
     logger.info(f"Simulation speed: {args.speed}")
+    logger.info(f"Server engine: {args.server} (workers: {args.workers}, backlog: {args.backlog})")
     logger.info(f"Logging level: {args.log_level}")
 
     run(
@@ -109,5 +116,9 @@ if __name__ == "__main__":
         cert_file=args.certfile,
         key_file=args.keyfile,
         desks=args.desks,
-        speed=args.speed
+        speed=args.speed,
+        server=args.server,
+        workers=args.workers,
+        backlog=args.backlog,
+        keepalive_timeout=args.keepalive_timeout,
     )
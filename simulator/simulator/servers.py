@@ -0,0 +1,211 @@
+import asyncio
+import io
+import logging
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import HTTPServer
+
+logger = logging.getLogger(__name__)
+
+SERVER_ENGINES = ("simple", "threaded", "asyncio")
+
+
+class ThreadPoolHTTPServer(HTTPServer):
+    """HTTP/1.1 keep-alive server that serves each connection on a bounded pool of worker threads."""
+    protocol_version = "HTTP/1.1"
+
+    def __init__(self, server_address, handler_class, ssl_context=None, workers=16, backlog=128, keepalive_timeout=15):
+        self.request_queue_size = backlog
+        self.ssl_context = ssl_context
+        self.keepalive_timeout = keepalive_timeout
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="http-worker")
+        # Accepting stops while every worker is busy, so waiting clients queue in the listen backlog
+        self.worker_slots = threading.BoundedSemaphore(workers)
+        self.connections = set()
+        self.connections_lock = threading.Lock()
+        super().__init__(server_address, handler_class)
+
+    def get_request(self):
+        """Accept a connection; the TLS handshake is deferred to the worker thread."""
+        request, client_address = super().get_request()
+        if self.ssl_context:
+            request = self.ssl_context.wrap_socket(request, server_side=True, do_handshake_on_connect=False)
+        return request, client_address
+
+    def process_request(self, request, client_address):
+        """Hand the connection to a worker, waiting for a free one if the pool is exhausted."""
+        self.worker_slots.acquire()
+        with self.connections_lock:
+            self.connections.add(request)
+        self.executor.submit(self._process_request_worker, request, client_address)
+
+    def _process_request_worker(self, request, client_address):
+        try:
+            if self.ssl_context:
+                request.do_handshake()
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            with self.connections_lock:
+                self.connections.discard(request)
+            self.shutdown_request(request)
+            self.worker_slots.release()
+
+    def server_close(self):
+        """Close the listening socket and any idle keep-alive connections still held by workers."""
+        super().server_close()
+        with self.connections_lock:
+            for request in self.connections:
+                try:
+                    request.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class _BufferedConnection:
+    """Socket stand-in that feeds one buffered request to a request handler and streams its response to an asyncio writer."""
+
+    def __init__(self, request_bytes, loop, writer):
+        self.request_bytes = request_bytes
+        self.loop = loop
+        self.writer = writer
+        self.keep_alive = None
+
+    def settimeout(self, timeout):
+        pass
+
+    def setsockopt(self, *args):
+        pass
+
+    def makefile(self, mode, buffering=None):
+        return io.BytesIO(self.request_bytes)
+
+    def sendall(self, data):
+        if self.writer.is_closing():
+            raise BrokenPipeError("Client connection closed")
+        if self.keep_alive is None:
+            # The first write carries the response headers: only length-delimited responses can be followed by another request
+            head = bytes(data).split(b"\r\n\r\n", 1)[0].lower()
+            self.keep_alive = b"\r\ncontent-length:" in head and b"\r\nconnection: close" not in head
+        self.loop.call_soon_threadsafe(self.writer.write, bytes(data))
+
+
+class AsyncioHTTPServer:
+    """HTTP/1.1 keep-alive server with an asyncio front end and a bounded pool of worker threads.
+
+    Connections are accepted, kept alive and parsed on the event loop, so idle clients cost no
+    thread. Complete requests are dispatched to the request handler on the worker pool.
+    """
+    protocol_version = "HTTP/1.1"
+    MAX_HEADER_BYTES = 65536
+
+    def __init__(self, server_address, handler_class, ssl_context=None, workers=16, backlog=128, keepalive_timeout=15):
+        self.server_address = server_address
+        self.handler_class = handler_class
+        self.ssl_context = ssl_context
+        self.backlog = backlog
+        self.keepalive_timeout = keepalive_timeout
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="http-worker")
+        self.loop = None
+        self.server = None
+
+    def serve_forever(self):
+        asyncio.run(self._serve())
+
+    async def _serve(self):
+        self.loop = asyncio.get_running_loop()
+        host, port = self.server_address
+        self.server = await asyncio.start_server(
+            self._handle_connection, host, port,
+            ssl=self.ssl_context, backlog=self.backlog, limit=self.MAX_HEADER_BYTES,
+        )
+        async with self.server:
+            try:
+                await self.server.serve_forever()
+            except asyncio.CancelledError:
+                pass
+
+    def shutdown(self):
+        """Stop serve_forever(); safe to call from another thread."""
+        if self.loop and self.server:
+            self.loop.call_soon_threadsafe(self.server.close)
+
+    def server_close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _parse_head(head):
+        lines = head.decode("iso-8859-1").split("\r\n")
+        headers = {}
+        for line in lines[1:]:
+            name, separator, value = line.partition(":")
+            if separator:
+                headers[name.strip().lower()] = value.strip()
+        return lines[0], headers
+
+    async def _read_request(self, reader, writer):
+        """Read one complete request (head and body) or return None when the connection should close."""
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.keepalive_timeout)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError, ConnectionError):
+            return None
+
+        request_line, headers = self._parse_head(head)
+        try:
+            content_length = int(headers.get("content-length", 0))
+        except ValueError:
+            return None
+
+        if headers.get("expect", "").lower() == "100-continue":
+            # Answer here, since the handler only sees the request once the body has arrived
+            writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+            head = b"\r\n".join(line for line in head.split(b"\r\n") if not line.lower().startswith(b"expect:"))
+
+        try:
+            body = await reader.readexactly(content_length)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return None
+
+        keep_alive = request_line.endswith("HTTP/1.1") and headers.get("connection", "").lower() != "close"
+        return head + body, keep_alive
+
+    async def _handle_connection(self, reader, writer):
+        client_address = writer.get_extra_info("peername")
+        try:
+            while True:
+                request = await self._read_request(reader, writer)
+                if request is None:
+                    break
+                request_bytes, keep_alive = request
+
+                connection = _BufferedConnection(request_bytes, self.loop, writer)
+                try:
+                    await self.loop.run_in_executor(self.executor, self.handler_class, connection, client_address, self)
+                except Exception as e:
+                    logger.error(f"Error handling request from {client_address}: {e}")
+                    break
+                await writer.drain()
+
+                if not (keep_alive and connection.keep_alive):
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+def create_server(engine, server_address, handler, ssl_context=None, workers=16, backlog=128, keepalive_timeout=15):
+    """Create the HTTP server for the selected serving engine."""
+    if engine == "simple":
+        httpd = HTTPServer(server_address, handler)
+        if ssl_context:
+            httpd.socket = ssl_context.wrap_socket(httpd.socket, server_side=True)
+        return httpd
+    if engine == "threaded":
+        return ThreadPoolHTTPServer(server_address, handler, ssl_context, workers, backlog, keepalive_timeout)
+    if engine == "asyncio":
+        return AsyncioHTTPServer(server_address, handler, ssl_context, workers, backlog, keepalive_timeout)
+    raise ValueError(f"Unknown server engine: {engine}")
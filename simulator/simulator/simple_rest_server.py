@@ -1,6 +1,8 @@
 import json
 import logging
 from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import urlsplit, parse_qs
+from desk import Desk
 from desk_manager import DeskManager
 
 logger = logging.getLogger(__name__)
@@ -13,8 +15,15 @@ class SimpleRESTServer(BaseHTTPRequestHandler):
     def __init__(self, desk_manager: DeskManager, *args, **kwargs):
         self.desk_manager = desk_manager
         self.path_parts = []
+        self.query = {}
         super().__init__(*args, **kwargs)
 
+    def setup(self):
+        # Concurrent server engines speak HTTP/1.1 keep-alive with an idle timeout
+        self.protocol_version = getattr(self.server, "protocol_version", self.protocol_version)
+        self.timeout = getattr(self.server, "keepalive_timeout", self.timeout)
+        super().setup()
+
     @staticmethod
     def load_api_keys(api_keys_file):
         """Static method to load API keys from a file."""
@@ -44,9 +53,23 @@ class SimpleRESTServer(BaseHTTPRequestHandler):
         self.wfile.write(response_body)
         logger.info(f"Response sent: {status_code} - {data}")
 
+    def _query_list(self, name):
+        """Return a comma separated (or repeated) query parameter as a list, or None if absent."""
+        if name not in self.query:
+            return None
+        return [item for value in self.query[name] for item in value.split(",") if item]
+
+    def _discard_body(self):
+        """Read and drop an unused request body so a keep-alive connection stays in sync."""
+        content_length = int(self.headers.get("Content-Length") or 0)
+        if content_length:
+            self.rfile.read(content_length)
+
     def _is_valid_path(self):
-        # Path format: /api/<version>/<api_key>/desks[/<desk_id>]
-        self.path_parts = self.path.strip("/").split("/")
+        # Path format: /api/<version>/<api_key>/desks[/<desk_id>][?<query>]
+        url = urlsplit(self.path)
+        self.path_parts = url.path.strip("/").split("/")
+        self.query = parse_qs(url.query)
 
         if len(self.path_parts) < 4 or self.path_parts[0] != "api":
             logger.warning(f"Invalid endpoint: {self.path}")
@@ -78,6 +101,8 @@ class SimpleRESTServer(BaseHTTPRequestHandler):
             if len(self.path_parts) == 4:
                 desk_ids = self.desk_manager.get_desk_ids()
                 self._send_response(200, desk_ids)
+            elif len(self.path_parts) == 5 and self.path_parts[4] == "bulk":
+                self._handle_bulk_get()
             elif len(self.path_parts) == 5:
                 desk_id = self.path_parts[4]
                 desk = self.desk_manager.get_desk_data(desk_id)
@@ -102,6 +127,19 @@ class SimpleRESTServer(BaseHTTPRequestHandler):
             logger.warning(f"Invalid endpoint for GET: {self.path}")
             self._send_response(400, {"error": "Invalid endpoint"})
 
+    def _handle_bulk_get(self):
+        """Send config, state, usage and lastErrors of many desks in one response."""
+        desk_ids = self._query_list("ids")
+        categories = self._query_list("categories") or Desk.CATEGORIES
+        unknown = [category for category in categories if category not in Desk.CATEGORIES]
+        if unknown:
+            logger.warning(f"Invalid categories for bulk GET: {unknown}")
+            self._send_response(400, {"error": "Invalid category"})
+            return
+
+        desks = self.desk_manager.get_desks_data(desk_ids, categories)
+        self._send_response(200, desks)
+
     def do_PUT(self):
         if not self._is_valid_path():
             return
@@ -142,14 +180,17 @@ class SimpleRESTServer(BaseHTTPRequestHandler):
     def do_POST(self):
         """Handle unsupported POST method."""
         logger.warning(f"POST method not allowed: {self.path}")
+        self._discard_body()
         self._send_response(405, {"error": "Method Not Allowed"})
 
     def do_DELETE(self):
         """Handle unsupported DELETE method."""
         logger.warning(f"DELETE method not allowed: {self.path}")
+        self._discard_body()
         self._send_response(405, {"error": "Method Not Allowed"})
 
     def do_PATCH(self):
         """Handle unsupported PATCH method."""
         logger.warning(f"PATCH method not allowed: {self.path}")
+        self._discard_body()
         self._send_response(405, {"error": "Method Not Allowed"})